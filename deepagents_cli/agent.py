@@ -221,6 +221,21 @@ def _format_fetch_url_description(tool_call: ToolCall, state: AgentState, runtim
     return f"URL: {url}\nTimeout: {timeout}s\n\n⚠️  Will fetch and convert web content to markdown"
 
 
+def _format_fetch_urls_batch_description(
+    tool_call: ToolCall, state: AgentState, runtime: Runtime
+) -> str:
+    """Format fetch_urls_batch tool call for approval prompt."""
+    args = tool_call["args"]
+    urls = args.get("urls") or []
+    timeout = args.get("timeout", 30)
+
+    url_lines = "\n".join(f"  - {url}" for url in urls) or "  (none)"
+    return (
+        f"URLs ({len(urls)}):\n{url_lines}\nTimeout: {timeout}s per URL\n\n"
+        "⚠️  Will fetch and convert web content to markdown"
+    )
+
+
 def _format_task_description(tool_call: ToolCall, state: AgentState, runtime: Runtime) -> str:
     """Format task (subagent) tool call for approval prompt."""
     args = tool_call["args"]
@@ -263,13 +278,23 @@ def _format_check_dependencies_description(
     args = tool_call["args"]
     tool_name = tool_call["name"]
 
+    if tool_name == "check_all_dependencies":
+        path = args.get("requirements_path", "requirements.txt")
+        check_pyproject = args.get("check_pyproject", True)
+        files = "pyproject.toml or requirements.txt" if check_pyproject else path
+        package_json = args.get("package_json_path", "package.json")
+        return (
+            f"Check Python dependencies from {files} and TypeScript dependencies "
+            f"from {package_json}\n\n"
+            "⚠️  Will query PyPI and run npm commands to check for package updates"
+        )
     if "python" in tool_name:
         path = args.get("requirements_path", "requirements.txt")
         check_pyproject = args.get("check_pyproject", True)
         files = "pyproject.toml or requirements.txt" if check_pyproject else path
         return (
             f"Check Python dependencies from {files}\n\n"
-            "⚠️  Will run pip commands to check for package updates"
+            "⚠️  Will query PyPI to check for package updates"
         )
     else:
         path = args.get("package_json_path", "package.json")
@@ -388,6 +413,11 @@ def create_agent_with_config(
             "description": _format_fetch_url_description,
         }
 
+        fetch_urls_batch_interrupt_config: InterruptOnConfig = {
+            "allowed_decisions": ["approve", "reject"],
+            "description": _format_fetch_urls_batch_description,
+        }
+
         task_interrupt_config: InterruptOnConfig = {
             "allowed_decisions": ["approve", "reject"],
             "description": _format_task_description,
@@ -403,6 +433,11 @@ def create_agent_with_config(
             "description": _format_check_dependencies_description,
         }
 
+        check_all_deps_interrupt_config: InterruptOnConfig = {
+            "allowed_decisions": ["approve", "reject"],
+            "description": _format_check_dependencies_description,
+        }
+
         interrupt_on_config = {
             "shell": shell_interrupt_config,
             "execute": execute_interrupt_config,
@@ -410,9 +445,11 @@ def create_agent_with_config(
             "edit_file": edit_file_interrupt_config,
             "web_search": web_search_interrupt_config,
             "fetch_url": fetch_url_interrupt_config,
+            "fetch_urls_batch": fetch_urls_batch_interrupt_config,
             "task": task_interrupt_config,
             "check_python_dependencies": check_python_deps_interrupt_config,
             "check_typescript_dependencies": check_typescript_deps_interrupt_config,
+            "check_all_dependencies": check_all_deps_interrupt_config,
         }
 
     agent = create_deep_agent(
@@ -16,9 +16,11 @@ from deepagents_cli.agent import create_agent_with_config, get_system_prompt
 from deepagents_cli.agent_memory import AgentMemoryMiddleware
 from deepagents_cli.config import console, create_model
 from deepagents_cli.tools import (
+    check_all_dependencies,
     check_python_dependencies,
     check_typescript_dependencies,
     fetch_url,
+    fetch_urls_batch,
     http_request,
     web_search,
 )
@@ -138,9 +140,11 @@ def create_server_agent(
     tools = [
         http_request,
         fetch_url,
+        fetch_urls_batch,
         web_search,
         check_python_dependencies,
         check_typescript_dependencies,
+        check_all_dependencies,
     ]
 
     model = create_model()
@@ -25,10 +25,13 @@ from deepagents_cli.integrations.sandbox_factory import (
     get_default_working_dir,
 )
 from deepagents_cli.tools import (
+    check_all_dependencies,
     check_python_dependencies,
     check_typescript_dependencies,
     fetch_url,
+    fetch_urls_batch,
     http_request,
+    warm_web_search,
     web_search,
 )
 from deepagents_cli.token_utils import calculate_baseline_tokens
@@ -216,13 +219,18 @@ async def _run_agent_session(
         sandbox_type: Type of sandbox being used
         setup_script_path: Path to setup script that was run (if any)
     """
+    # Connect to the search API while the agent is being set up
+    warm_web_search()
+
     # Create agent with tools
     tools = [
         http_request,
         fetch_url,
+        fetch_urls_batch,
         web_search,
         check_python_dependencies,
         check_typescript_dependencies,
+        check_all_dependencies,
     ]
 
     agent, composite_backend = create_agent_with_config(
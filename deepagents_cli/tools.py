@@ -1,14 +1,374 @@
 """Custom tools for the CLI agent."""
 
-import json
+import asyncio
+import atexit
+import copy
+import functools
+import hashlib
+import io
 import os
+import re
+import shutil
+import sqlite3
 import subprocess
+import threading
+import time
+import tomllib
+from collections.abc import Coroutine, Iterable, Mapping
+from contextlib import closing, suppress
+from http.cookiejar import DefaultCookiePolicy
+from importlib import metadata
 from pathlib import Path
 from typing import Any, Literal
 
+import httpx
+import orjson
 import requests
+from cachetools import TTLCache
 from markdownify import markdownify
-from tavily import TavilyClient
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from tavily import AsyncTavilyClient
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (compatible; DeepAgents/1.0)"
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session shared by the web tools.
+
+    Reusing one session keeps connections alive between tool calls, so repeat
+    requests to the same host skip DNS lookup, TCP connect, and TLS handshake.
+    Only connection failures are retried: read timeouts must surface as timeouts,
+    and a request that reached the server must not be sent again. Cookies are
+    rejected so each tool call stays stateless.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, connect=2, read=False, status=0, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    session.headers["Accept-Encoding"] = "br, gzip, deflate"
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+_SESSION = _create_session()
+
+
+def _create_async_client(
+    max_connections: int, timeout: float, keepalive_expiry: float = 5.0
+) -> httpx.AsyncClient:
+    """Create an HTTP/2-capable client for the concurrent tools.
+
+    HTTP/2 multiplexes parallel requests to the same origin over a single TLS
+    connection, so batches hitting one host don't queue behind the pool size.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=16,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(timeout),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+_FETCH_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "deepagents"
+    / "fetch_url.sqlite3"
+)
+# Bump whenever the pages table changes; older databases are dropped and rebuilt
+_FETCH_CACHE_SCHEMA_VERSION = 2
+_FETCH_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds since an entry was last served
+_FETCH_CACHE_MAX_BYTES = 64 * 1024 * 1024  # total UTF-8 markdown kept across all entries
+
+
+def _fetch_cache_connect() -> sqlite3.Connection:
+    """Open the fetch_url cache database, (re)creating the schema when needed."""
+    _FETCH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_FETCH_CACHE_PATH, timeout=5)
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != _FETCH_CACHE_SCHEMA_VERSION:
+        conn.execute("DROP TABLE IF EXISTS pages")
+        # Let evictions give pages back to the filesystem; only takes effect on VACUUM
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        with conn:
+            conn.execute(
+                "CREATE TABLE pages ("
+                "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+                "url TEXT NOT NULL, status_code INTEGER NOT NULL, markdown TEXT NOT NULL, "
+                "converted INTEGER NOT NULL, used_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            # Covers both the age cut-off and the size total without touching the pages
+            conn.execute("CREATE INDEX pages_used_at ON pages (used_at, size)")
+            conn.execute(f"PRAGMA user_version = {_FETCH_CACHE_SCHEMA_VERSION}")
+    return conn
+
+
+def _fetch_cache_key(url: str, engine: str) -> str:
+    return hashlib.blake2b(f"{engine}\0{url}".encode(), digest_size=16).hexdigest()
+
+
+def _fetch_cache_get(url: str, engine: str) -> dict[str, Any] | None:
+    """Return the cached page record for a URL, or None on miss or cache failure."""
+    try:
+        with closing(_fetch_cache_connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, url, status_code, markdown, converted "
+                "FROM pages WHERE key = ? AND used_at > ?",
+                (_fetch_cache_key(url, engine), time.time() - _FETCH_CACHE_MAX_AGE),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    etag, last_modified, final_url, status_code, markdown, converted = row
+    return {
+        "etag": etag,
+        "last_modified": last_modified,
+        "url": final_url,
+        "status_code": status_code,
+        "markdown": markdown,
+        "converted": bool(converted),
+    }
+
+
+def _fetch_cache_touch(url: str, engine: str) -> None:
+    """Mark a cached page as recently served so eviction keeps it."""
+    try:
+        with closing(_fetch_cache_connect()) as conn, conn:
+            conn.execute(
+                "UPDATE pages SET used_at = ? WHERE key = ?",
+                (time.time(), _fetch_cache_key(url, engine)),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _fetch_cache_put(url: str, engine: str, record: dict[str, Any]) -> None:
+    """Store a page record for a URL and evict stale or excess entries.
+
+    Entries unused for ``_FETCH_CACHE_MAX_AGE`` are dropped, then the least
+    recently used ones until the stored markdown fits in ``_FETCH_CACHE_MAX_BYTES``.
+    Sizes are recorded at insert time, so this never re-reads the stored pages.
+    Cache failures never fail the fetch.
+    """
+    now = time.time()
+    try:
+        with closing(_fetch_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(key, etag, last_modified, url, status_code, markdown, converted, used_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _fetch_cache_key(url, engine),
+                    record["etag"],
+                    record["last_modified"],
+                    record["url"],
+                    record["status_code"],
+                    record["markdown"],
+                    record["converted"],
+                    now,
+                    len(record["markdown"].encode()),
+                ),
+            )
+            evicted = conn.execute(
+                "DELETE FROM pages WHERE used_at <= ?", (now - _FETCH_CACHE_MAX_AGE,)
+            ).rowcount
+            (excess,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) - ? FROM pages", (_FETCH_CACHE_MAX_BYTES,)
+            ).fetchone()
+            if excess > 0:
+                doomed = []
+                oldest_first = conn.execute(
+                    "SELECT key, size FROM pages ORDER BY used_at, rowid"
+                ).fetchall()
+                for key, size in oldest_first:
+                    doomed.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM pages WHERE key = ?", doomed)
+                evicted += len(doomed)
+            if evicted:
+                conn.execute("PRAGMA incremental_vacuum")
+    except sqlite3.Error:
+        pass
+
+
+# Elements removed before conversion: non-content markup and page chrome
+_SKIP_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "svg",
+        "template",
+        "nav",
+        "footer",
+        "aside",
+    }
+)
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_LIST_TAGS = frozenset({"ul", "ol"})
+_STRONG_TAGS = frozenset({"strong", "b"})
+_EMPHASIS_TAGS = _STRONG_TAGS | {"em", "i"}
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "main",
+        "header",
+        "table",
+        "tr",
+        "figure",
+        "form",
+    }
+)
+_CELL_TAGS = frozenset({"td", "th"})
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n{2,}")
+_BLANKLINES_RE = re.compile(r"\n{3,}")
+# Stands in for newlines inside fenced code until rendering is finished, so the
+# whitespace clean-up passes never see (and rewrite) the code's own lines
+_CODE_NEWLINE = "\ue000"
+
+
+def _wrap_inline(text: str, opening: str, closing: str) -> str:
+    """Wrap inline markup around text, keeping its edge whitespace outside the markers."""
+    stripped = text.strip()
+    leading = text[: len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()) :]
+    return f"{leading}{opening}{stripped}{closing}{trailing}"
+
+
+def _render_children(node: LexborNode) -> str:
+    """Render the children of an element, joining inline and block output."""
+    parts: list[str] = []
+    for child in node.iter(include_text=True):
+        rendered = _render_node(child)
+        if not rendered:
+            continue
+        # Drop whitespace carried over from the HTML source at the start of a line;
+        # at the start of an element it is kept for inline markup to place
+        if parts and parts[-1].endswith("\n"):
+            rendered = rendered.lstrip(" ")
+        parts.append(rendered)
+    return "".join(parts)
+
+
+def _render_list(node: LexborNode, *, ordered: bool) -> str:
+    """Render a ul/ol element, indenting nested content under each marker."""
+    items: list[str] = []
+    for child in node.iter(include_text=False):
+        if child.tag != "li":
+            continue
+        marker = f"{len(items) + 1}. " if ordered else "- "
+        content = _PARAGRAPH_BREAK_RE.sub("\n", _render_children(child).strip())
+        indent = " " * len(marker)
+        content = content.replace("\n", "\n" + indent)
+        items.append(marker + content.replace(_CODE_NEWLINE, _CODE_NEWLINE + indent))
+    return "\n\n" + "\n".join(items) + "\n\n"
+
+
+def _render_node(node: LexborNode) -> str:
+    """Render a single node (and its subtree) as markdown."""
+    if node.is_text_node:
+        return _WHITESPACE_RE.sub(" ", node.text(deep=False))
+    if not node.is_element_node:
+        return ""
+
+    tag = node.tag
+    if tag in _HEADING_TAGS:
+        return f"\n\n{'#' * int(tag[1])} {_render_children(node).strip()}\n\n"
+    if tag in _LIST_TAGS:
+        return _render_list(node, ordered=tag == "ol")
+    if tag == "pre":
+        code = node.css_first("code")
+        classes = (code.attributes.get("class") or "") if code else ""
+        language = next(
+            (c.removeprefix("language-") for c in classes.split() if c.startswith("language-")),
+            "",
+        )
+        code_text = node.text(deep=True).strip("\n").replace("\n", _CODE_NEWLINE)
+        return f"\n\n```{language}{_CODE_NEWLINE}{code_text}{_CODE_NEWLINE}```\n\n"
+    if tag == "blockquote":
+        quoted = _BLANKLINES_RE.sub("\n\n", _render_children(node).strip())
+        lines = (f"> {line}".rstrip() for line in quoted.split("\n"))
+        return "\n\n" + "\n".join(lines).replace(_CODE_NEWLINE, _CODE_NEWLINE + "> ") + "\n\n"
+    if tag == "a":
+        text = _render_children(node)
+        href = node.attributes.get("href")
+        return _wrap_inline(text, "[", f"]({href})") if text.strip() and href else text
+    if tag == "img":
+        src = node.attributes.get("src")
+        return f"![{node.attributes.get('alt') or ''}]({src})" if src else ""
+    if tag == "code":
+        text = node.text(deep=True)
+        return f"`{text}`" if text else ""
+    if tag in _EMPHASIS_TAGS:
+        text = _render_children(node)
+        if not text.strip():
+            return text
+        mark = "**" if tag in _STRONG_TAGS else "*"
+        return _wrap_inline(text, mark, mark)
+    if tag == "br":
+        return "\n"
+    if tag == "hr":
+        return "\n\n---\n\n"
+    if tag == "li":
+        return f"\n- {_render_children(node).strip()}\n"
+    if tag in _BLOCK_TAGS:
+        return f"\n\n{_render_children(node).strip()}\n\n"
+    if tag in _CELL_TAGS:
+        return f" {_render_children(node).strip()} "
+    return _render_children(node)
+
+
+def _html_to_markdown(html: str) -> str:
+    """Convert an HTML document to markdown using the lexbor-backed selectolax parser.
+
+    Parsing happens in C; only the walk over the resulting tree runs in Python,
+    which makes this considerably faster than markdownify on large pages.
+    """
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(list(_SKIP_TAGS))
+    root = tree.body or tree.root
+    if root is None:
+        return ""
+    markdown = _BLANKLINES_RE.sub("\n\n", _TRAILING_WS_RE.sub("\n", _render_children(root)))
+    return markdown.strip().replace(_CODE_NEWLINE, "\n")
+
+
+def _convert_html(html: str, engine: str) -> str:
+    """Convert HTML to markdown with the requested engine."""
+    if engine == "markdownify":
+        return markdownify(html)
+    return _html_to_markdown(html)
+
+
+def _project_headers(headers: Mapping[str, str], whitelist: list[str] | None) -> dict[str, str]:
+    """Copy response headers into a plain dict, keeping only whitelisted names if given."""
+    if whitelist is None:
+        return dict(headers)
+    return {name: headers[name] for name in whitelist if name in headers}
 
 
 def http_request(
@@ -18,6 +378,7 @@ def http_request(
     data: str | dict | None = None,
     params: dict[str, str] | None = None,
     timeout: int = 30,
+    headers_whitelist: list[str] | None = None,
 ) -> dict[str, Any]:
     """Make HTTP requests to APIs and web services.
 
@@ -28,6 +389,9 @@ def http_request(
         data: Request body data (string or dict)
         params: URL query parameters
         timeout: Request timeout in seconds
+        headers_whitelist: Only return these response headers (case-insensitive).
+            Pass the few headers you need to keep large header sets out of the result.
+            Returns all response headers when omitted.
 
     Returns:
         Dictionary with response data including status, headers, and content
@@ -45,17 +409,23 @@ def http_request(
             else:
                 kwargs["data"] = data
 
-        response = requests.request(**kwargs)
+        response = _SESSION.request(**kwargs)
 
-        try:
-            content = response.json()
-        except:
+        # Only decode bodies that claim to be JSON; everything else is returned as text
+        content_type = response.headers.get("Content-Type", "")
+        content: Any
+        if "json" in content_type:
+            try:
+                content = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                content = response.text
+        else:
             content = response.text
 
         return {
             "success": response.status_code < 400,
             "status_code": response.status_code,
-            "headers": dict(response.headers),
+            "headers": _project_headers(response.headers, headers_whitelist),
             "content": content,
             "url": response.url,
         }
@@ -86,6 +456,166 @@ def http_request(
         }
 
 
+# Repeat searches within a session are served from memory. News results go
+# stale quickly, so they get a much shorter lifetime.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=256, ttl=600)
+_NEWS_SEARCH_CACHE: TTLCache = TTLCache(maxsize=64, ttl=60)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+_TAVILY_API_URL = "https://api.tavily.com"
+
+
+class _SearchBatcher:
+    """Coalesce web searches issued close together into concurrent batches.
+
+    Searches are queued on a background event loop. The first queued search
+    opens a short collection window; everything queued within it (up to
+    max_batch_size) is sent to Tavily concurrently, and identical searches in
+    the same batch share a single request. One Tavily client, backed by an
+    HTTP/2 connection pool the batcher owns, is kept per API key for the
+    lifetime of the loop, so its connection stays open between batches.
+    """
+
+    def __init__(self, max_batch_size: int = 10, max_wait: float = 0.01) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._clients: dict[str, AsyncTavilyClient] = {}
+        self._http_clients: dict[str, httpx.AsyncClient] = {}
+
+    def search(self, api_key: str, query: str, **kwargs: Any) -> dict[str, Any]:
+        """Queue a search and block until its batch has been executed."""
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self._submit(api_key, query, kwargs), loop)
+        return future.result()
+
+    def warm(self, api_key: str) -> None:
+        """Open the Tavily connection for api_key in the background, without waiting."""
+        loop = self._ensure_started()
+        asyncio.run_coroutine_threadsafe(self._warm(api_key), loop)
+
+    async def _warm(self, api_key: str) -> None:
+        self._client(api_key)
+        # Any response will do: the TLS handshake is the point, and the
+        # connection it opens stays in the pool for the first search
+        with suppress(httpx.HTTPError):
+            await self._http_clients[api_key].head("/")
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="web-search-batcher", daemon=True
+                ).start()
+                self._queue = asyncio.Queue()
+                asyncio.run_coroutine_threadsafe(self._drain(), loop)
+                self._loop = loop
+                atexit.register(self.close)
+            return self._loop
+
+    def close(self) -> None:
+        """Cancel pending work and stop the background event loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        with suppress(Exception):
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), loop).result(timeout=1)
+        loop.call_soon_threadsafe(loop.stop)
+
+    async def _cancel_tasks(self) -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._clients = {}
+        http_clients, self._http_clients = self._http_clients, {}
+        for http_client in http_clients.values():
+            await http_client.aclose()
+
+    def _client(self, api_key: str) -> AsyncTavilyClient:
+        client = self._clients.get(api_key)
+        if client is None:
+            # Keep idle connections around long enough to bridge the gaps between turns
+            http_client = _create_async_client(
+                max_connections=self.max_batch_size, timeout=60, keepalive_expiry=120
+            )
+            http_client.base_url = _TAVILY_API_URL
+            self._http_clients[api_key] = http_client
+            client = self._clients[api_key] = AsyncTavilyClient(api_key=api_key, client=http_client)
+        return client
+
+    async def _submit(self, api_key: str, query: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((api_key, query, kwargs, future))
+        return await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+            # Run the batch in the background so the next window opens immediately
+            task = loop.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[str, str, dict[str, Any], asyncio.Future]]
+    ) -> None:
+        try:
+            await self._search_batch(batch)
+        except Exception as e:
+            # Never leave a caller blocked on a batch that failed as a whole
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _search_batch(
+        self, batch: list[tuple[str, str, dict[str, Any], asyncio.Future]]
+    ) -> None:
+        waiters: dict[tuple, list[asyncio.Future]] = {}
+        requests_by_key: dict[tuple, tuple[str, str, dict[str, Any]]] = {}
+        for api_key, query, kwargs, future in batch:
+            key = (api_key, query, tuple(sorted(kwargs.items())))
+            waiters.setdefault(key, []).append(future)
+            requests_by_key[key] = (api_key, query, kwargs)
+
+        results = await asyncio.gather(
+            *(
+                self._client(api_key).search(query, **kwargs)
+                for api_key, query, kwargs in requests_by_key.values()
+            ),
+            return_exceptions=True,
+        )
+
+        for key, result in zip(requests_by_key, results, strict=True):
+            for index, future in enumerate(waiters[key]):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    # Every caller gets its own copy of a shared result
+                    future.set_result(result if index == 0 else copy.deepcopy(result))
+
+
+_SEARCH_BATCHER = _SearchBatcher()
+
+
 def web_search(
     query: str,
     max_results: int = 5,
@@ -119,7 +649,6 @@ def web_search(
     4. Cite sources by mentioning the page titles or URLs
     5. NEVER show the raw JSON to the user - always provide a formatted response
     """
-    # Create client locally to avoid pickling issues with global instance
     tavily_api_key = os.environ.get("TAVILY_API_KEY")
     if not tavily_api_key:
         return {
@@ -127,9 +656,16 @@ def web_search(
             "query": query,
         }
 
+    cache = _NEWS_SEARCH_CACHE if topic == "news" else _SEARCH_CACHE
+    key = (query, topic, max_results, include_raw_content)
+    with _SEARCH_CACHE_LOCK:
+        cached = cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     try:
-        tavily_client = TavilyClient(api_key=tavily_api_key)
-        return tavily_client.search(
+        result = _SEARCH_BATCHER.search(
+            tavily_api_key,
             query,
             max_results=max_results,
             include_raw_content=include_raw_content,
@@ -138,17 +674,122 @@ def web_search(
     except Exception as e:
         return {"error": f"Web search error: {e!s}", "query": query}
 
+    if "error" not in result:
+        with _SEARCH_CACHE_LOCK:
+            cache[key] = copy.deepcopy(result)
+    return result
+
+
+_HTML_CONTENT_TYPES = frozenset({"", "text/html", "application/xhtml+xml"})
+_TEXT_CONTENT_TYPES = frozenset(
+    {
+        "application/json",
+        "application/xml",
+        "application/javascript",
+        "application/x-yaml",
+    }
+)
+
+
+def _is_html(content_type: str) -> bool:
+    """Whether a media type should go through HTML to markdown conversion.
+
+    A missing Content-Type is treated as HTML, matching what browsers assume.
+    """
+    return content_type in _HTML_CONTENT_TYPES
+
+
+def _is_text(content_type: str) -> bool:
+    """Whether a non-HTML media type can be returned verbatim as text."""
+    return (
+        content_type.startswith("text/")
+        or content_type in _TEXT_CONTENT_TYPES
+        or content_type.endswith(("+json", "+xml"))
+    )
+
+
+def _media_type(headers: Mapping[str, str]) -> str:
+    """Return the bare, lowercased media type from a response's Content-Type."""
+    return headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+
+
+def _check_declared_size(headers: Mapping[str, str], max_bytes: int) -> None:
+    declared = headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        msg = f"response is {declared} bytes, larger than max_bytes ({max_bytes})"
+        raise ValueError(msg)
+
+
+def _decode_body(body: bytes, encoding: str | None) -> str:
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _read_body(response: requests.Response, max_bytes: int) -> str:
+    """Stream a response body into memory, refusing bodies larger than max_bytes.
+
+    Raises:
+        ValueError: If the (decompressed) body is larger than max_bytes.
+    """
+    _check_declared_size(response.headers, max_bytes)
 
-def fetch_url(url: str, timeout: int = 30) -> dict[str, Any]:
+    buffer = io.BytesIO()
+    for chunk in response.iter_content(chunk_size=65536):
+        buffer.write(chunk)
+        if buffer.tell() > max_bytes:
+            msg = f"response is larger than max_bytes ({max_bytes})"
+            raise ValueError(msg)
+
+    # requests assumes ISO-8859-1 for text/* without a charset; most pages are UTF-8
+    content_type = response.headers.get("Content-Type", "").lower()
+    encoding = response.encoding if "charset=" in content_type else None
+    return _decode_body(buffer.getvalue(), encoding)
+
+
+async def _aread_body(response: httpx.Response, max_bytes: int) -> str:
+    """Async counterpart of _read_body for streamed httpx responses.
+
+    Raises:
+        ValueError: If the (decompressed) body is larger than max_bytes.
+    """
+    _check_declared_size(response.headers, max_bytes)
+
+    buffer = io.BytesIO()
+    async for chunk in response.aiter_bytes(chunk_size=65536):
+        buffer.write(chunk)
+        if buffer.tell() > max_bytes:
+            msg = f"response is larger than max_bytes ({max_bytes})"
+            raise ValueError(msg)
+
+    # httpx already falls back to UTF-8 when the response declares no charset
+    return _decode_body(buffer.getvalue(), response.encoding)
+
+
+def fetch_url(
+    url: str,
+    timeout: int = 30,
+    force_refresh: bool = False,
+    engine: Literal["selectolax", "markdownify"] = "selectolax",
+    max_bytes: int = 10_000_000,
+) -> dict[str, Any]:
     """Fetch content from a URL and convert HTML to markdown format.
 
     This tool fetches web page content and converts it to clean markdown text,
     making it easy to read and process HTML content. After receiving the markdown,
     you MUST synthesize the information into a natural, helpful response for the user.
 
+    Pages are cached on disk and revalidated with the server on each call, so
+    unchanged pages are returned without being downloaded or converted again.
+
     Args:
         url: The URL to fetch (must be a valid HTTP/HTTPS URL)
         timeout: Request timeout in seconds (default: 30)
+        force_refresh: Ignore the cache and always download the page (default: False)
+        engine: HTML to markdown converter - "selectolax" (fast, default) or
+            "markdownify" (slower, use if the default output looks wrong)
+        max_bytes: Refuse pages larger than this many bytes (default: 10 MB)
 
     Returns:
         Dictionary containing:
@@ -157,6 +798,8 @@ def fetch_url(url: str, timeout: int = 30) -> dict[str, Any]:
         - markdown_content: The page content converted to markdown
         - status_code: HTTP status code
         - content_length: Length of the markdown content in characters
+        - converted: Whether the page was converted from HTML (plain text,
+          markdown and JSON responses are returned verbatim)
 
     IMPORTANT: After using this tool:
     1. Read through the markdown content
@@ -165,55 +808,312 @@ def fetch_url(url: str, timeout: int = 30) -> dict[str, Any]:
     4. NEVER show the raw markdown to the user unless specifically requested
     """
     try:
-        response = requests.get(
-            url,
-            timeout=timeout,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; DeepAgents/1.0)"},
-        )
-        response.raise_for_status()
+        cached = None if force_refresh else _fetch_cache_get(url, engine)
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with _SESSION.get(url, timeout=timeout, headers=headers, stream=True) as response:
+            # Unchanged since last fetch: skip the download and markdown conversion
+            if cached is not None and response.status_code == 304:  # noqa: PLR2004
+                _fetch_cache_touch(url, engine)
+                return {
+                    "url": cached["url"],
+                    "markdown_content": cached["markdown"],
+                    "status_code": cached["status_code"],
+                    "content_length": len(cached["markdown"]),
+                    "converted": cached["converted"],
+                }
+
+            response.raise_for_status()
+
+            content_type = _media_type(response.headers)
+            converted = _is_html(content_type)
+            if not converted and not _is_text(content_type):
+                return {
+                    "error": f"Fetch URL error: unsupported content type {content_type}",
+                    "url": url,
+                }
+            body = _read_body(response, max_bytes)
+
+        # Convert HTML content to markdown; text, markdown and JSON are already readable
+        markdown_content = _convert_html(body, engine) if converted else body
 
-        # Convert HTML content to markdown
-        markdown_content = markdownify(response.text)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _fetch_cache_put(
+                url,
+                engine,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "url": str(response.url),
+                    "status_code": response.status_code,
+                    "markdown": markdown_content,
+                    "converted": converted,
+                },
+            )
 
         return {
             "url": str(response.url),
             "markdown_content": markdown_content,
             "status_code": response.status_code,
             "content_length": len(markdown_content),
+            "converted": converted,
         }
     except Exception as e:
         return {"error": f"Fetch URL error: {e!s}", "url": url}
 
 
-def check_python_dependencies(
-    requirements_path: str = "requirements.txt",
-    check_pyproject: bool = True,
+async def _fetch_one(
+    client: httpx.AsyncClient, url: str, timeout: int, max_bytes: int
 ) -> dict[str, Any]:
-    """Check Python dependencies and suggest upgrades.
+    """Fetch a single URL on a shared client and convert it to markdown."""
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+
+            content_type = _media_type(response.headers)
+            converted = _is_html(content_type)
+            if not converted and not _is_text(content_type):
+                return {
+                    "error": f"Fetch URL error: unsupported content type {content_type}",
+                    "url": url,
+                }
+            body = await _aread_body(response, max_bytes)
+    except httpx.TimeoutException:
+        return {"error": f"Fetch URL error: timed out after {timeout} seconds", "url": url}
+    except Exception as e:
+        return {"error": f"Fetch URL error: {e!s}", "url": url}
+
+    markdown_content = _html_to_markdown(body) if converted else body
+    return {
+        "url": str(response.url),
+        "markdown_content": markdown_content,
+        "status_code": response.status_code,
+        "content_length": len(markdown_content),
+        "converted": converted,
+    }
 
-    This tool analyzes Python dependencies from requirements.txt or pyproject.toml
-    and suggests available upgrades using pip.
+
+async def _fetch_batch(urls: list[str], timeout: int, max_bytes: int) -> list[dict[str, Any]]:
+    """Fetch all URLs concurrently over one pooled client."""
+    async with _create_async_client(max_connections=64, timeout=timeout) as client:
+        return await asyncio.gather(*(_fetch_one(client, url, timeout, max_bytes) for url in urls))
+
+
+def fetch_urls_batch(
+    urls: list[str], timeout: int = 30, max_bytes: int = 10_000_000
+) -> dict[str, Any]:
+    """Fetch several URLs concurrently and convert each page from HTML to markdown.
+
+    Prefer this over calling fetch_url repeatedly when you already know every URL
+    you need: all pages are downloaded in parallel, so the total time is roughly
+    that of the slowest page. As with fetch_url, plain text, markdown and JSON
+    pages are returned verbatim and non-text responses are refused. After
+    receiving the markdown, you MUST synthesize the information into a natural,
+    helpful response for the user.
 
     Args:
-        requirements_path: Path to requirements.txt file (default: "requirements.txt")
-        check_pyproject: Also check pyproject.toml if it exists (default: True)
+        urls: The URLs to fetch (each must be a valid HTTP/HTTPS URL)
+        timeout: Per-URL request timeout in seconds (default: 30)
+        max_bytes: Refuse pages larger than this many bytes (default: 10 MB)
 
     Returns:
         Dictionary containing:
-        - dependencies: List of current dependencies with versions
-        - outdated: List of packages that have newer versions available
-        - upgrades: Suggested upgrade commands
-        - source: Which file was analyzed
+        - results: One entry per input URL, in the same order, each shaped like
+          the result of fetch_url (or containing an "error" key on failure)
+        - succeeded: Number of URLs fetched successfully
+        - failed: Number of URLs that could not be fetched
+    """
+    try:
+        results = asyncio.run(_fetch_batch(urls, timeout, max_bytes))
+    except Exception as e:
+        return {"error": f"Fetch URLs batch error: {e!s}", "urls": urls}
 
-    Example:
-        >>> check_python_dependencies()
-        {
-            "dependencies": [{"name": "requests", "current": "2.28.0", "latest": "2.31.0"}],
-            "outdated": ["requests"],
-            "upgrades": ["pip install requests==2.31.0"],
-            "source": "requirements.txt"
-        }
+    failed = sum(1 for result in results if "error" in result)
+    return {
+        "results": results,
+        "succeeded": len(results) - failed,
+        "failed": failed,
+    }
+
+
+_EXECUTABLES: dict[str, str] = {}
+
+
+def _executable(name: str) -> str | None:
+    """Resolve a command on PATH once and reuse the absolute path afterwards.
+
+    Misses are not remembered, so a command installed mid-session is found.
+    """
+    path = _EXECUTABLES.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _EXECUTABLES[name] = path
+    return path
+
+
+async def _run(
+    cmd: list[str],
+    *,
+    timeout: float,
+    cwd: Path | None = None,
+) -> bytes:
+    """Run a command without blocking the event loop and return its stdout.
+
+    Stderr is discarded. The exit code is not checked, since tools such as
+    npm outdated exit non-zero to report findings.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish within timeout seconds.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=cwd,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+    return stdout
+
+
+_PYPI_JSON_URL = "https://pypi.org/pypi/{name}/json"
+
+# requirements.txt syntax: backslash continuations, " #" comments and
+# per-requirement options such as --hash
+_LINE_CONTINUATION_RE = re.compile(r"\\\r?\n")
+_REQUIREMENT_COMMENT_RE = re.compile(r"(?:^|\s)#")
+_REQUIREMENT_OPTION_RE = re.compile(r"\s--")
+
+# Latest released version per canonical package name, shared across calls
+_PYPI_VERSION_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_PYPI_VERSION_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _declared_requirements(
+    path: str,
+    file_key: tuple[int, int, int],  # noqa: ARG001
+) -> tuple[str, ...]:
+    """Read requirement strings from a pyproject.toml or requirements.txt file.
+
+    Cached per file identity and modification time (st_dev, st_ino,
+    st_mtime_ns), so unchanged files are neither re-read nor re-parsed, the
+    same relative path in another directory is a different entry, and any
+    edit invalidates it.
+    """
+    return tuple(_read_declared_requirements(Path(path)))
+
+
+def _read_declared_requirements(path: Path) -> list[str]:
+    """Read requirement strings from a pyproject.toml or requirements.txt file."""
+    if path.name == "pyproject.toml":
+        pyproject = tomllib.loads(path.read_text())
+        return list(pyproject.get("project", {}).get("dependencies", []))
+
+    requirements = []
+    text = _LINE_CONTINUATION_RE.sub(" ", path.read_text())
+    for raw_line in text.splitlines():
+        line = _REQUIREMENT_COMMENT_RE.split(raw_line, maxsplit=1)[0].strip()
+        # Skip blanks and pip options such as -r or --index-url; editable installs
+        # are kept so they are reported as unparseable instead of vanishing
+        if not line or (line.startswith("-") and not line.startswith(("-e", "--editable"))):
+            continue
+        requirements.append(_REQUIREMENT_OPTION_RE.split(line, maxsplit=1)[0].strip())
+    return requirements
+
+
+def _installed_requirements(
+    requirement_strings: Iterable[str],
+) -> tuple[dict[str, tuple[str, str]], list[str]]:
+    """Map canonical name to (declared name, installed version) for installed requirements.
+
+    Requirements that do not apply to this environment or are not installed are
+    skipped. Returns the mapping and the requirement strings that could not be
+    parsed.
     """
+    installed: dict[str, tuple[str, str]] = {}
+    unparseable: list[str] = []
+    for requirement_string in requirement_strings:
+        try:
+            requirement = Requirement(requirement_string)
+        except InvalidRequirement:
+            unparseable.append(requirement_string)
+            continue
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+        try:
+            version = metadata.version(requirement.name)
+        except metadata.PackageNotFoundError:
+            continue
+        installed[canonicalize_name(requirement.name)] = (requirement.name, version)
+    return installed, unparseable
+
+
+async def _fetch_latest_version(
+    client: httpx.AsyncClient, name: str, timeout: int
+) -> str | Exception:
+    """Look up the latest released version of a package on PyPI."""
+    try:
+        response = await client.get(_PYPI_JSON_URL.format(name=name))
+        response.raise_for_status()
+        return orjson.loads(response.content)["info"]["version"]
+    except httpx.TimeoutException:
+        return TimeoutError(f"timed out after {timeout} seconds")
+    except Exception as e:
+        return e
+
+
+async def _latest_versions(names: list[str], timeout: int) -> dict[str, str | Exception]:
+    """Return the latest PyPI version for each canonical package name.
+
+    Cached versions are reused; the rest are fetched concurrently over one
+    keep-alive client.
+    """
+    with _PYPI_VERSION_CACHE_LOCK:
+        latest: dict[str, str | Exception] = {
+            name: _PYPI_VERSION_CACHE[name] for name in names if name in _PYPI_VERSION_CACHE
+        }
+    missing = [name for name in names if name not in latest]
+    if not missing:
+        return latest
+
+    async with _create_async_client(max_connections=20, timeout=timeout) as client:
+        fetched = await asyncio.gather(
+            *(_fetch_latest_version(client, name, timeout) for name in missing)
+        )
+
+    with _PYPI_VERSION_CACHE_LOCK:
+        for name, version in zip(missing, fetched, strict=True):
+            latest[name] = version
+            if isinstance(version, str):
+                _PYPI_VERSION_CACHE[name] = version
+    return latest
+
+
+def _is_newer(latest: str, current: str) -> bool:
+    """Whether latest is a newer version than current. Unparseable versions never are."""
+    try:
+        return Version(latest) > Version(current)
+    except InvalidVersion:
+        return False
+
+
+async def _check_python_dependencies(
+    requirements_path: str, check_pyproject: bool
+) -> dict[str, Any]:
+    """Implementation of check_python_dependencies."""
     try:
         result: dict[str, Any] = {
             "dependencies": [],
@@ -222,52 +1122,165 @@ def check_python_dependencies(
             "source": None,
         }
 
-        # Check which dependency file exists
-        req_path = Path(requirements_path)
-        pyproject_path = Path("pyproject.toml")
-
-        if check_pyproject and pyproject_path.exists():
-            result["source"] = "pyproject.toml"
-        elif req_path.exists():
-            result["source"] = str(requirements_path)
+        # Check which dependency file exists; the one stat also keys the parse cache
+        candidates = [requirements_path]
+        if check_pyproject:
+            candidates.insert(0, "pyproject.toml")
+        for candidate in candidates:
+            try:
+                stat = os.stat(candidate)
+            except FileNotFoundError:
+                continue
+            result["source"] = str(candidate)
+            break
         else:
             return {
                 "error": f"No dependency file found. Checked: {requirements_path}, pyproject.toml"
             }
 
-        # Check for outdated packages
-        outdated_result = subprocess.run(
-            ["pip", "list", "--outdated", "--format=json"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30,
+        # Compare installed versions of the declared packages against PyPI
+        declared = _declared_requirements(
+            result["source"], (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
         )
-        outdated = json.loads(outdated_result.stdout)
+        installed, unparseable = _installed_requirements(declared)
+        latest_versions = await _latest_versions(list(installed), timeout=30)
 
         # Build response
-        for pkg in outdated:
-            result["dependencies"].append({
-                "name": pkg["name"],
-                "current": pkg["version"],
-                "latest": pkg["latest_version"],
-            })
-            result["outdated"].append(pkg["name"])
-            result["upgrades"].append(f"pip install {pkg['name']}=={pkg['latest_version']}")
+        lookups = [
+            (name, current, latest_versions[canonical_name])
+            for canonical_name, (name, current) in installed.items()
+        ]
+        errors = [f"{line}: not a requirement that can be checked" for line in unparseable]
+        errors += [
+            f"{name}: {latest!s}" for name, _, latest in lookups if isinstance(latest, Exception)
+        ]
+        deps = [
+            {"name": name, "current": current, "latest": latest}
+            for name, current, latest in lookups
+            if isinstance(latest, str) and _is_newer(latest, current)
+        ]
+        result["dependencies"] = deps
+        result["outdated"] = [dep["name"] for dep in deps]
+        result["upgrades"] = [f"pip install {dep['name']}=={dep['latest']}" for dep in deps]
 
+        if errors:
+            result["errors"] = errors
         if not result["outdated"]:
             result["message"] = "All dependencies are up to date!"
 
         return result
 
-    except subprocess.CalledProcessError as e:
-        return {"error": f"Failed to check dependencies: {e.stderr}"}
-    except subprocess.TimeoutExpired:
-        return {"error": "Command timed out after 30 seconds"}
     except Exception as e:
         return {"error": f"Error checking Python dependencies: {e!s}"}
 
 
+async def _check_typescript_dependencies(package_json_path: str) -> dict[str, Any]:
+    """Implementation of check_typescript_dependencies."""
+    try:
+        pkg_path = Path(package_json_path)
+
+        if not pkg_path.exists():
+            return {"error": f"No package.json found at: {package_json_path}"}
+
+        result: dict[str, Any] = {
+            "dependencies": [],
+            "outdated": [],
+            "upgrades": [],
+            "source": package_json_path,
+        }
+
+        npm = _executable("npm")
+        if npm is None:
+            return {"error": "npm is not installed or not in PATH"}
+
+        # Check for outdated packages using npm outdated
+        stdout = await _run([npm, "outdated", "--json"], timeout=60, cwd=pkg_path.parent)
+
+        # npm outdated returns exit code 1 when there are outdated packages
+        if stdout:
+            try:
+                outdated = orjson.loads(stdout)
+            except orjson.JSONDecodeError:
+                return {"error": "Failed to parse npm outdated output"}
+
+            deps = [
+                {
+                    "name": pkg_name,
+                    "current": pkg_info.get("current", "N/A"),
+                    "wanted": pkg_info.get("wanted", "N/A"),
+                    "latest": pkg_info.get("latest", "N/A"),
+                }
+                for pkg_name, pkg_info in outdated.items()
+            ]
+            result["dependencies"] = deps
+            result["outdated"] = [dep["name"] for dep in deps]
+            result["upgrades"] = [
+                f"npm install {dep['name']}@{'latest' if dep['latest'] == 'N/A' else dep['latest']}"
+                for dep in deps
+            ]
+
+        if not result["outdated"]:
+            result["message"] = "All dependencies are up to date!"
+
+        return result
+
+    except FileNotFoundError:
+        return {"error": "npm is not installed or not in PATH"}
+    except subprocess.TimeoutExpired:
+        return {"error": "npm command timed out after 60 seconds"}
+    except Exception as e:
+        return {"error": f"Error checking TypeScript dependencies: {e!s}"}
+
+
+def _run_check(coro: Coroutine[Any, Any, dict[str, Any]], error_prefix: str) -> dict[str, Any]:
+    """Run a dependency check coroutine, reporting failures as an error dict.
+
+    asyncio.run refuses to start inside a running event loop; the check then
+    returns an error like any other failure instead of raising.
+    """
+    try:
+        return asyncio.run(coro)
+    except Exception as e:
+        coro.close()
+        return {"error": f"{error_prefix}: {e!s}"}
+
+
+def check_python_dependencies(
+    requirements_path: str = "requirements.txt",
+    check_pyproject: bool = True,
+) -> dict[str, Any]:
+    """Check Python dependencies and suggest upgrades.
+
+    This tool analyzes Python dependencies from requirements.txt or pyproject.toml
+    and suggests available upgrades by comparing installed versions against PyPI.
+
+    Args:
+        requirements_path: Path to requirements.txt file (default: "requirements.txt")
+        check_pyproject: Also check pyproject.toml if it exists (default: True)
+
+    Returns:
+        Dictionary containing:
+        - dependencies: List of current dependencies with versions
+        - outdated: List of packages that have newer versions available
+        - upgrades: Suggested upgrade commands
+        - source: Which file was analyzed
+        - errors: Packages whose latest version could not be looked up (if any)
+
+    Example:
+        >>> check_python_dependencies()
+        {
+            "dependencies": [{"name": "requests", "current": "2.28.0", "latest": "2.31.0"}],
+            "outdated": ["requests"],
+            "upgrades": ["pip install requests==2.31.0"],
+            "source": "requirements.txt"
+        }
+    """
+    return _run_check(
+        _check_python_dependencies(requirements_path, check_pyproject),
+        "Error checking Python dependencies",
+    )
+
+
 def check_typescript_dependencies(
     package_json_path: str = "package.json",
 ) -> dict[str, Any]:
@@ -295,55 +1308,56 @@ def check_typescript_dependencies(
             "source": "package.json"
         }
     """
-    try:
-        pkg_path = Path(package_json_path)
+    return _run_check(
+        _check_typescript_dependencies(package_json_path),
+        "Error checking TypeScript dependencies",
+    )
 
-        if not pkg_path.exists():
-            return {"error": f"No package.json found at: {package_json_path}"}
 
-        result: dict[str, Any] = {
-            "dependencies": [],
-            "outdated": [],
-            "upgrades": [],
-            "source": package_json_path,
-        }
+async def _check_all_dependencies(
+    requirements_path: str, check_pyproject: bool, package_json_path: str
+) -> dict[str, Any]:
+    """Run the Python and TypeScript checks concurrently."""
+    python, typescript = await asyncio.gather(
+        _check_python_dependencies(requirements_path, check_pyproject),
+        _check_typescript_dependencies(package_json_path),
+    )
+    return {"python": python, "typescript": typescript}
 
-        # Check for outdated packages using npm outdated
-        outdated_result = subprocess.run(
-            ["npm", "outdated", "--json"],
-            capture_output=True,
-            text=True,
-            cwd=pkg_path.parent,
-            timeout=60,
-        )
 
-        # npm outdated returns exit code 1 when there are outdated packages
-        if outdated_result.stdout:
-            try:
-                outdated = json.loads(outdated_result.stdout)
-
-                for pkg_name, pkg_info in outdated.items():
-                    result["dependencies"].append({
-                        "name": pkg_name,
-                        "current": pkg_info.get("current", "N/A"),
-                        "wanted": pkg_info.get("wanted", "N/A"),
-                        "latest": pkg_info.get("latest", "N/A"),
-                    })
-                    result["outdated"].append(pkg_name)
-                    result["upgrades"].append(
-                        f"npm install {pkg_name}@{pkg_info.get('latest', 'latest')}"
-                    )
-            except json.JSONDecodeError:
-                return {"error": "Failed to parse npm outdated output"}
+def check_all_dependencies(
+    requirements_path: str = "requirements.txt",
+    check_pyproject: bool = True,
+    package_json_path: str = "package.json",
+) -> dict[str, Any]:
+    """Check Python and TypeScript/Node.js dependencies at the same time.
 
-        if not result["outdated"]:
-            result["message"] = "All dependencies are up to date!"
+    Use this instead of calling check_python_dependencies and
+    check_typescript_dependencies one after the other: both checks run
+    concurrently, so this takes only as long as the slower of the two.
 
-        return result
+    Args:
+        requirements_path: Path to requirements.txt file (default: "requirements.txt")
+        check_pyproject: Also check pyproject.toml if it exists (default: True)
+        package_json_path: Path to package.json file (default: "package.json")
 
-    except FileNotFoundError:
-        return {"error": "npm is not installed or not in PATH"}
-    except subprocess.TimeoutExpired:
-        return {"error": "npm command timed out after 60 seconds"}
-    except Exception as e:
-        return {"error": f"Error checking TypeScript dependencies: {e!s}"}
+    Returns:
+        Dictionary containing:
+        - python: The check_python_dependencies result
+        - typescript: The check_typescript_dependencies result
+    """
+    return _run_check(
+        _check_all_dependencies(requirements_path, check_pyproject, package_json_path),
+        "Error checking dependencies",
+    )
+
+
+def warm_web_search() -> None:
+    """Open the web_search connection to Tavily in the background.
+
+    Call this when an interactive session starts so the first search skips the
+    DNS lookup and TLS handshake. Does nothing without TAVILY_API_KEY.
+    """
+    tavily_api_key = os.environ.get("TAVILY_API_KEY")
+    if tavily_api_key:
+        _SEARCH_BATCHER.warm(tavily_api_key)
@@ -133,6 +133,12 @@ def format_tool_display(tool_name: str, tool_args: dict) -> str:
             url = truncate_value(url, 80)
             return f'{tool_name}("{url}")'
 
+    elif tool_name == "fetch_urls_batch":
+        # Batch fetch: show how many URLs are being fetched
+        if "urls" in tool_args and isinstance(tool_args["urls"], list):
+            count = len(tool_args["urls"])
+            return f"{tool_name}({count} urls)"
+
     elif tool_name == "task":
         # Task: show the task description
         if "description" in tool_args:
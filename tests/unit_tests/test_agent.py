@@ -3,9 +3,11 @@
 from unittest.mock import Mock
 
 from deepagents_cli.agent import (
+    _format_check_dependencies_description,
     _format_edit_file_description,
     _format_execute_description,
     _format_fetch_url_description,
+    _format_fetch_urls_batch_description,
     _format_shell_description,
     _format_task_description,
     _format_web_search_description,
@@ -183,6 +185,48 @@ def test_format_fetch_url_description_default_timeout():
     assert "Timeout: 30s" in description
 
 
+def test_format_fetch_urls_batch_description():
+    """Test fetch_urls_batch description formatting."""
+    tool_call = {
+        "name": "fetch_urls_batch",
+        "args": {
+            "urls": ["https://example.com/a", "https://example.com/b"],
+        },
+        "id": "call-8b",
+    }
+
+    state = Mock()
+    runtime = Mock()
+
+    description = _format_fetch_urls_batch_description(tool_call, state, runtime)
+
+    assert "URLs (2):" in description
+    assert "  - https://example.com/a" in description
+    assert "Timeout: 30s per URL" in description
+
+
+def test_format_check_all_dependencies_description():
+    """Test check_all_dependencies description covers both ecosystems."""
+    tool_call = {
+        "name": "check_all_dependencies",
+        "args": {
+            "requirements_path": "requirements-dev.txt",
+            "check_pyproject": False,
+            "package_json_path": "web/package.json",
+        },
+        "id": "call-8c",
+    }
+
+    state = Mock()
+    runtime = Mock()
+
+    description = _format_check_dependencies_description(tool_call, state, runtime)
+
+    assert "Check Python dependencies from requirements-dev.txt" in description
+    assert "TypeScript dependencies from web/package.json" in description
+    assert "⚠️  Will query PyPI and run npm commands to check for package updates" in description
+
+
 def test_format_task_description():
     """Test task (subagent) description formatting."""
     tool_call = {
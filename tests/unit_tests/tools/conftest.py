@@ -0,0 +1,37 @@
+"""Shared fixtures for tool tests."""
+
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from deepagents_cli import tools
+
+
+@pytest.fixture(autouse=True)
+def _isolated_fetch_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the fetch_url disk cache out of the user's home directory."""
+    monkeypatch.setattr(tools, "_FETCH_CACHE_PATH", tmp_path / "fetch_url.sqlite3")
+
+
+@pytest.fixture
+def serve() -> Iterator[Callable[[type[BaseHTTPRequestHandler]], str]]:
+    """Start local HTTP servers for tools that don't go through requests.
+
+    Returns a function that serves the given handler class and returns its base URL.
+    """
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(handler: type[BaseHTTPRequestHandler]) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
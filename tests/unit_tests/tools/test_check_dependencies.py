@@ -0,0 +1,280 @@
+"""Tests for the dependency check tools."""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler
+from importlib import metadata
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from deepagents_cli import tools
+from deepagents_cli.tools import (
+    check_all_dependencies,
+    check_python_dependencies,
+    check_typescript_dependencies,
+)
+
+NPM_OUTDATED = {"typescript": {"current": "4.9.0", "wanted": "4.9.5", "latest": "5.3.0"}}
+PYTEST_VERSION = metadata.version("pytest")
+
+
+class _PyPIHandler(BaseHTTPRequestHandler):
+    """Serves PyPI's JSON API: requests is outdated, pytest is current."""
+
+    latest: ClassVar[dict[str, str | None]] = {"requests": "999.0.0", "pytest": PYTEST_VERSION}
+    # When set, each request waits (briefly) for a fake npm to start, see _rendezvous
+    rendezvous: ClassVar[Path | None] = None
+    requested: ClassVar[list[str]] = []
+
+    def do_GET(self) -> None:
+        self.requested.append(self.path)
+        if self.rendezvous is not None:
+            _rendezvous(self.rendezvous, "pypi", "npm")
+        name = self.path.split("/")[2]
+        if name not in self.latest:
+            self.send_response(404)
+            self.end_headers()
+            return
+        info = {"version": self.latest[name]} if self.latest[name] else {}
+        body = json.dumps({"info": info}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def _rendezvous(directory: Path, mine: str, theirs: str) -> None:
+    """Announce this side has started, then wait up to 5s for the other side.
+
+    Leaves a "<mine>-saw-<theirs>" marker only if the other side started while
+    this one was still running, which is what proves the two overlapped.
+    """
+    (directory / mine).touch()
+    deadline = time.monotonic() + 5
+    while not (directory / theirs).exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    if (directory / theirs).exists():
+        (directory / f"{mine}-saw-{theirs}").touch()
+
+
+def _write_fake_command(
+    bin_dir: Path,
+    name: str,
+    output: object,
+    exit_code: int = 0,
+    rendezvous: Path | None = None,
+) -> None:
+    prelude = ""
+    if rendezvous is not None:
+        # Shell version of _rendezvous
+        prelude = (
+            f"touch {rendezvous}/npm\ni=0\n"
+            f"while [ ! -e {rendezvous}/pypi ] && [ $i -lt 500 ]; do sleep 0.01; i=$((i+1)); done\n"
+            f"[ -e {rendezvous}/pypi ] && touch {rendezvous}/npm-saw-pypi\n"
+        )
+    script = bin_dir / name
+    script.write_text(
+        f"#!/bin/sh\n{prelude}cat <<'EOF'\n{json.dumps(output)}\nEOF\nexit {exit_code}\n"
+    )
+    script.chmod(0o755)
+
+
+@pytest.fixture
+def project(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    serve: Callable[[type[BaseHTTPRequestHandler]], str],
+) -> Path:
+    """A project directory backed by a local PyPI and a fake npm first on PATH."""
+    base_url = serve(_PyPIHandler)
+    monkeypatch.setattr(tools, "_PYPI_JSON_URL", base_url + "/pypi/{name}/json")
+    monkeypatch.setattr(_PyPIHandler, "requested", [])
+    tools._PYPI_VERSION_CACHE.clear()
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    # npm outdated exits with 1 when it finds outdated packages
+    _write_fake_command(bin_dir, "npm", NPM_OUTDATED, exit_code=1)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    tools._EXECUTABLES.clear()
+
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\ndependencies = ["requests>=2", "pytest", '
+        '"not-installed-pkg", "colorama; sys_platform == \'nonexistent\'"]\n'
+    )
+    (project_dir / "package.json").write_text("{}")
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+@pytest.mark.usefixtures("project")
+def test_check_python_dependencies() -> None:
+    """Test that installed versions are compared against PyPI."""
+    result = check_python_dependencies()
+
+    assert result["source"] == "pyproject.toml"
+    assert result["outdated"] == ["requests"]
+    assert result["upgrades"] == ["pip install requests==999.0.0"]
+    assert result["dependencies"][0]["current"] == metadata.version("requests")
+    assert "errors" not in result
+
+
+def test_check_python_dependencies_requirements_txt(project: Path) -> None:
+    """Test that requirements.txt is parsed, skipping comments and pip options."""
+    (project / "requirements.txt").write_text(
+        "# pinned deps\n-r base.txt\npytest  # test runner\nrequests==2.0\n"
+    )
+
+    result = check_python_dependencies(check_pyproject=False)
+
+    assert result["source"] == "requirements.txt"
+    assert result["outdated"] == ["requests"]
+
+
+def test_check_python_dependencies_pip_compile_output(project: Path) -> None:
+    """Test that hash-pinned, tab-commented and editable lines are not silently lost."""
+    (project / "requirements.txt").write_text(
+        "# This file is autogenerated by pip-compile\n"
+        "requests==2.0.0 \\\n"
+        "    --hash=sha256:aaaa \\\n"
+        "    --hash=sha256:bbbb\n"
+        "    # via -r requirements.in\n"
+        f"pytest=={PYTEST_VERSION}\t# test runner\n"
+        "-e git+https://github.com/example/demo.git#egg=demo\n"
+    )
+
+    result = check_python_dependencies(check_pyproject=False)
+
+    assert result["outdated"] == ["requests"]
+    assert "/pypi/pytest/json" in _PyPIHandler.requested
+    assert result["errors"] == [
+        (
+            "-e git+https://github.com/example/demo.git#egg=demo: "
+            "not a requirement that can be checked"
+        )
+    ]
+
+
+@pytest.mark.usefixtures("project")
+def test_check_python_dependencies_malformed_pypi_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an unexpected PyPI response is reported for that package only."""
+    monkeypatch.setattr(_PyPIHandler, "latest", {**_PyPIHandler.latest, "requests": None})
+
+    result = check_python_dependencies()
+
+    assert result["outdated"] == []
+    assert len(result["errors"]) == 1
+    assert result["errors"][0].startswith("requests: ")
+
+
+@pytest.mark.usefixtures("project")
+def test_check_python_dependencies_caches_pypi_lookups() -> None:
+    """Test that repeat checks reuse cached PyPI versions."""
+    check_python_dependencies()
+    requested = list(_PyPIHandler.requested)
+    result = check_python_dependencies()
+
+    assert result["outdated"] == ["requests"]
+    assert requested
+    assert _PyPIHandler.requested == requested
+
+
+def test_check_python_dependencies_rereads_edited_file(project: Path) -> None:
+    """Test that the cached dependency list is invalidated when the file changes."""
+    pyproject = project / "pyproject.toml"
+    assert check_python_dependencies()["outdated"] == ["requests"]
+
+    pyproject.write_text('[project]\nname = "demo"\ndependencies = ["pytest"]\n')
+    stat = pyproject.stat()
+    os.utime(pyproject, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert check_python_dependencies()["outdated"] == []
+
+
+def test_check_python_dependencies_no_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing dependency file is reported."""
+    monkeypatch.chdir(tmp_path)
+
+    result = check_python_dependencies()
+
+    assert "No dependency file found" in result["error"]
+
+
+@pytest.mark.usefixtures("project")
+def test_check_typescript_dependencies() -> None:
+    """Test that npm's outdated output is parsed despite its non-zero exit code."""
+    result = check_typescript_dependencies()
+
+    assert result["outdated"] == ["typescript"]
+    assert result["upgrades"] == ["npm install typescript@5.3.0"]
+
+
+def test_check_typescript_dependencies_without_npm(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a missing npm is reported without spawning a process."""
+    monkeypatch.setenv("PATH", str(project))
+    tools._EXECUTABLES.clear()
+
+    result = check_typescript_dependencies()
+
+    assert result == {"error": "npm is not installed or not in PATH"}
+
+
+def test_check_typescript_dependencies_finds_npm_installed_later(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed npm lookup is retried rather than cached."""
+    path = os.environ["PATH"]
+    monkeypatch.setenv("PATH", str(project))
+    tools._EXECUTABLES.clear()
+    assert "error" in check_typescript_dependencies()
+
+    monkeypatch.setenv("PATH", path)
+
+    assert check_typescript_dependencies()["outdated"] == ["typescript"]
+
+
+@pytest.mark.usefixtures("project")
+def test_check_all_dependencies_runs_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that both checks run and overlap instead of running back to back."""
+    rendezvous = tmp_path / "rendezvous"
+    rendezvous.mkdir()
+    monkeypatch.setattr(_PyPIHandler, "rendezvous", rendezvous)
+    _write_fake_command(tmp_path / "bin", "npm", NPM_OUTDATED, exit_code=1, rendezvous=rendezvous)
+
+    result = check_all_dependencies()
+
+    assert result["python"]["outdated"] == ["requests"]
+    assert result["typescript"]["outdated"] == ["typescript"]
+    # Run back to back, whichever check went first would have waited in vain
+    assert (rendezvous / "pypi-saw-npm").exists()
+    assert (rendezvous / "npm-saw-pypi").exists()
+
+
+@pytest.mark.parametrize(
+    "check", [check_python_dependencies, check_typescript_dependencies, check_all_dependencies]
+)
+@pytest.mark.usefixtures("project")
+def test_checks_report_errors_inside_running_event_loop(check: Callable[[], dict]) -> None:
+    """Test that calling a check from inside an event loop returns an error dict."""
+
+    async def call() -> dict:
+        return check()
+
+    result = asyncio.run(call())
+
+    assert "asyncio.run() cannot be called from a running event loop" in result["error"]
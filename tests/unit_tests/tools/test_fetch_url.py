@@ -1,9 +1,14 @@
 """Tests for tools module."""
 
+import sqlite3
+from contextlib import closing
+
+import pytest
 import requests
 import responses
 
-from deepagents_cli.tools import fetch_url
+from deepagents_cli import tools
+from deepagents_cli.tools import USER_AGENT, _html_to_markdown, fetch_url
 
 
 @responses.activate
@@ -70,3 +75,231 @@ def test_fetch_url_connection_error() -> None:
     assert "error" in result
     assert "Fetch URL error" in result["error"]
     assert result["url"] == "http://example.com/error"
+
+
+@responses.activate
+def test_fetch_url_sends_user_agent() -> None:
+    """Test that requests go out through the shared session with its User-Agent."""
+    responses.add(
+        responses.GET,
+        "http://example.com/ua",
+        body="<p>ok</p>",
+        status=200,
+    )
+
+    fetch_url("http://example.com/ua")
+
+    assert responses.calls[0].request.headers["User-Agent"] == USER_AGENT
+
+
+@responses.activate
+def test_fetch_url_revalidates_cached_page() -> None:
+    """Test that a cached page is revalidated and served from cache on 304."""
+    responses.add(
+        responses.GET,
+        "http://example.com/cached",
+        body="<h1>Cached</h1>",
+        status=200,
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    responses.add(
+        responses.GET,
+        "http://example.com/cached",
+        status=304,
+        match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    first = fetch_url("http://example.com/cached")
+    second = fetch_url("http://example.com/cached")
+
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-Modified-Since"] == (
+        "Wed, 01 Jan 2025 00:00:00 GMT"
+    )
+    assert second == first
+    assert second["status_code"] == 200
+
+
+def test_fetch_cache_rebuilds_outdated_schema() -> None:
+    """Test that a cache database from an older schema is dropped, not reused."""
+    with closing(sqlite3.connect(tools._FETCH_CACHE_PATH)) as conn, conn:
+        conn.execute("CREATE TABLE pages (key TEXT PRIMARY KEY, markdown TEXT)")
+    record = {
+        "etag": '"v1"',
+        "last_modified": None,
+        "url": "http://example.com/",
+        "status_code": 200,
+        "markdown": "hello",
+        "converted": False,
+    }
+
+    tools._fetch_cache_put("http://example.com/", "selectolax", record)
+
+    assert tools._fetch_cache_get("http://example.com/", "selectolax") == record
+
+
+def test_fetch_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the cache drops the oldest entries once it exceeds its size cap."""
+    monkeypatch.setattr(tools, "_FETCH_CACHE_MAX_BYTES", 10)
+    for url in ("http://example.com/a", "http://example.com/b"):
+        tools._fetch_cache_put(
+            url,
+            "selectolax",
+            {
+                "etag": '"v1"',
+                "last_modified": None,
+                "url": url,
+                "status_code": 200,
+                # 3 characters but 6 bytes: the cap counts bytes
+                "markdown": "é" * 3,
+                "converted": False,
+            },
+        )
+
+    assert tools._fetch_cache_get("http://example.com/a", "selectolax") is None
+    assert tools._fetch_cache_get("http://example.com/b", "selectolax") is not None
+
+
+@responses.activate
+def test_fetch_url_force_refresh_skips_cache() -> None:
+    """Test that force_refresh sends an unconditional request."""
+    for body in ("<p>old</p>", "<p>new</p>"):
+        responses.add(
+            responses.GET,
+            "http://example.com/fresh",
+            body=body,
+            status=200,
+            headers={"ETag": '"v1"'},
+        )
+
+    fetch_url("http://example.com/fresh")
+    result = fetch_url("http://example.com/fresh", force_refresh=True)
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert "new" in result["markdown_content"]
+
+
+def test_html_to_markdown_structure() -> None:
+    """Test that the selectolax converter emits markdown for common tags."""
+    html = (
+        "<html><head><style>p {}</style></head><body>"
+        "<nav>Home | Docs</nav>"
+        "<h2>Title</h2>"
+        '<p>Some <strong>bold</strong> and <a href="/docs">a link</a>.</p>'
+        "<ul><li>one</li><li>two<ol><li>nested</li></ol></li></ul>"
+        '<pre><code class="language-python">x = 1</code></pre>'
+        "<script>alert(1)</script>"
+        "<footer>Copyright</footer>"
+        "</body></html>"
+    )
+
+    markdown = _html_to_markdown(html)
+
+    assert markdown == (
+        "## Title\n\n"
+        "Some **bold** and [a link](/docs).\n\n"
+        "- one\n"
+        "- two\n"
+        "  1. nested\n\n"
+        "```python\nx = 1\n```"
+    )
+
+
+def test_html_to_markdown_leaves_code_blocks_untouched() -> None:
+    """Test that blank lines and trailing spaces inside pre survive clean-up."""
+    code = "def a():\n    pass\n\n\ndef b():    \n    pass"
+
+    assert _html_to_markdown(f"<pre>{code}</pre>") == f"```\n{code}\n```"
+    assert _html_to_markdown(f"<ul><li>item<pre>{code}</pre></li></ul>") == (
+        "- item\n  ```\n  " + code.replace("\n", "\n  ") + "\n  ```"
+    )
+
+
+def test_html_to_markdown_keeps_whitespace_around_inline_markup() -> None:
+    """Test that whitespace at the edges of inline elements stays between words."""
+    assert _html_to_markdown("foo <b>bar </b>baz") == "foo **bar** baz"
+    assert _html_to_markdown("hello<em> world </em>!") == "hello *world* !"
+    assert _html_to_markdown('see<a href="x"> here </a>now') == "see [here](x) now"
+
+
+@responses.activate
+def test_fetch_url_markdownify_engine() -> None:
+    """Test that the markdownify engine is still available as a fallback."""
+    responses.add(
+        responses.GET,
+        "http://example.com/legacy",
+        body="<h1>Legacy</h1>",
+        content_type="text/html",
+        status=200,
+    )
+
+    result = fetch_url("http://example.com/legacy", engine="markdownify")
+
+    assert result["markdown_content"].strip() == "Legacy\n======"
+
+
+@responses.activate
+def test_fetch_url_rejects_oversized_page() -> None:
+    """Test that pages larger than max_bytes are refused."""
+    responses.add(
+        responses.GET,
+        "http://example.com/huge",
+        body="<p>" + "x" * 2048 + "</p>",
+        status=200,
+    )
+
+    result = fetch_url("http://example.com/huge", max_bytes=1024)
+
+    assert "error" in result
+    assert "max_bytes (1024)" in result["error"]
+
+
+@responses.activate
+def test_fetch_url_decodes_utf8_without_charset() -> None:
+    """Test that bodies without a declared charset are decoded as UTF-8."""
+    responses.add(
+        responses.GET,
+        "http://example.com/utf8",
+        body="<p>café</p>".encode(),
+        content_type="text/html",
+        status=200,
+    )
+
+    result = fetch_url("http://example.com/utf8")
+
+    assert result["markdown_content"] == "café"
+    assert result["converted"] is True
+
+
+@responses.activate
+def test_fetch_url_returns_plain_text_verbatim() -> None:
+    """Test that non-HTML text responses skip markdown conversion."""
+    body = "# Title\n\n<not html>\n"
+    responses.add(
+        responses.GET,
+        "http://example.com/llms.txt",
+        body=body,
+        content_type="text/plain; charset=utf-8",
+        status=200,
+    )
+
+    result = fetch_url("http://example.com/llms.txt")
+
+    assert result["markdown_content"] == body
+    assert result["converted"] is False
+
+
+@responses.activate
+def test_fetch_url_rejects_binary_content() -> None:
+    """Test that binary responses are refused instead of decoded."""
+    responses.add(
+        responses.GET,
+        "http://example.com/image.png",
+        body=b"\x89PNG",
+        content_type="image/png",
+        status=200,
+    )
+
+    result = fetch_url("http://example.com/image.png")
+
+    assert "unsupported content type image/png" in result["error"]
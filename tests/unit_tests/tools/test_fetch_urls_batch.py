@@ -0,0 +1,84 @@
+"""Tests for the fetch_urls_batch tool."""
+
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler
+from typing import ClassVar
+
+import pytest
+
+from deepagents_cli.tools import fetch_urls_batch
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    pages: ClassVar[dict[str, tuple[str, str]]] = {
+        "/notes.txt": ("text/plain", "<b>not html</b>"),
+        "/logo.png": ("image/png", "\x89PNG"),
+        "/big": ("text/html", "x" * 2048),
+    }
+
+    def do_GET(self) -> None:
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        content_type, body = self.pages.get(
+            self.path,
+            ("text/html; charset=utf-8", f"<html><body><h1>Page {self.path}</h1></body></html>"),
+        )
+        body = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def base_url(serve: Callable[[type[BaseHTTPRequestHandler]], str]) -> str:
+    return serve(_PageHandler)
+
+
+def test_fetch_urls_batch_success(base_url: str) -> None:
+    """Test that every URL is fetched and results keep input order."""
+    urls = [f"{base_url}/a", f"{base_url}/b", f"{base_url}/c"]
+
+    result = fetch_urls_batch(urls)
+
+    assert result["succeeded"] == 3
+    assert result["failed"] == 0
+    for url, page in zip(urls, result["results"], strict=True):
+        assert page["url"] == url
+        assert page["status_code"] == 200
+        assert f"Page {url.removeprefix(base_url)}" in page["markdown_content"]
+
+
+def test_fetch_urls_batch_partial_failure(base_url: str) -> None:
+    """Test that one failing URL does not fail the whole batch."""
+    result = fetch_urls_batch([f"{base_url}/ok", f"{base_url}/missing"])
+
+    assert result["succeeded"] == 1
+    assert result["failed"] == 1
+    assert "Fetch URL error" in result["results"][1]["error"]
+    assert result["results"][1]["url"] == f"{base_url}/missing"
+
+
+def test_fetch_urls_batch_content_types(base_url: str) -> None:
+    """Test that only HTML is converted and non-text responses are refused."""
+    result = fetch_urls_batch([f"{base_url}/page", f"{base_url}/notes.txt", f"{base_url}/logo.png"])
+
+    page, notes, logo = result["results"]
+    assert page["converted"] is True
+    assert notes["converted"] is False
+    assert notes["markdown_content"] == "<b>not html</b>"
+    assert "unsupported content type image/png" in logo["error"]
+
+
+def test_fetch_urls_batch_max_bytes(base_url: str) -> None:
+    """Test that pages larger than max_bytes are refused."""
+    result = fetch_urls_batch([f"{base_url}/page", f"{base_url}/big"], max_bytes=1024)
+
+    assert result["succeeded"] == 1
+    assert "larger than max_bytes" in result["results"][1]["error"]
@@ -0,0 +1,157 @@
+"""Tests for the http_request tool."""
+
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+import responses
+
+from deepagents_cli.tools import http_request
+
+
+@responses.activate
+def test_http_request_json() -> None:
+    """Test that JSON responses are decoded."""
+    responses.add(
+        responses.GET,
+        "http://api.example.com/items",
+        json={"items": [1, 2]},
+        status=200,
+    )
+
+    result = http_request("http://api.example.com/items")
+
+    assert result["success"] is True
+    assert result["status_code"] == 200
+    assert result["content"] == {"items": [1, 2]}
+
+
+@responses.activate
+def test_http_request_text() -> None:
+    """Test that non-JSON responses fall back to text."""
+    responses.add(
+        responses.GET,
+        "http://example.com/page",
+        body="<html>hi</html>",
+        content_type="text/html",
+        status=200,
+    )
+
+    result = http_request("http://example.com/page")
+
+    assert result["content"] == "<html>hi</html>"
+
+
+@responses.activate
+def test_http_request_post_json_body() -> None:
+    """Test that dict bodies are sent as JSON."""
+    responses.add(
+        responses.POST,
+        "http://api.example.com/items",
+        json={"created": True},
+        status=201,
+        match=[responses.matchers.json_params_matcher({"name": "x"})],
+    )
+
+    result = http_request("http://api.example.com/items", method="post", data={"name": "x"})
+
+    assert result["success"] is True
+    assert result["status_code"] == 201
+
+
+@responses.activate
+def test_http_request_timeout() -> None:
+    """Test handling of request timeout."""
+    responses.add(
+        responses.GET,
+        "http://example.com/slow",
+        body=requests.exceptions.Timeout(),
+    )
+
+    result = http_request("http://example.com/slow", timeout=1)
+
+    assert result["success"] is False
+    assert "timed out after 1 seconds" in result["content"]
+
+
+@responses.activate
+def test_http_request_invalid_json_falls_back_to_text() -> None:
+    """Test that a body mislabelled as JSON is returned as text."""
+    responses.add(
+        responses.GET,
+        "http://api.example.com/broken",
+        body="not json",
+        content_type="application/json",
+        status=200,
+    )
+
+    result = http_request("http://api.example.com/broken")
+
+    assert result["content"] == "not json"
+
+
+@responses.activate
+def test_http_request_headers_whitelist() -> None:
+    """Test that only whitelisted response headers are returned."""
+    responses.add(
+        responses.GET,
+        "http://api.example.com/items",
+        json={},
+        headers={"ETag": '"abc"', "Set-Cookie": "a=b", "X-Cache": "HIT"},
+        status=200,
+    )
+
+    result = http_request("http://api.example.com/items", headers_whitelist=["etag", "X-Missing"])
+
+    assert result["headers"] == {"etag": '"abc"'}
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self) -> None:
+        type(self).hits += 1
+        time.sleep(1.5)
+        self.send_response(200)
+        self.end_headers()
+
+    def do_PUT(self) -> None:
+        self.do_GET()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def test_http_request_read_timeout_is_not_retried(
+    serve: Callable[[type[BaseHTTPRequestHandler]], str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a slow server times out once instead of being retried."""
+    monkeypatch.setattr(_SlowHandler, "hits", 0)
+    base_url = serve(_SlowHandler)
+
+    start = time.monotonic()
+    result = http_request(f"{base_url}/slow", method="PUT", data="x", timeout=0.5)
+
+    assert result["content"] == "Request timed out after 0.5 seconds"
+    assert _SlowHandler.hits == 1
+    assert time.monotonic() - start < 1.5
+
+
+@responses.activate
+def test_http_request_does_not_keep_cookies() -> None:
+    """Test that cookies set by one call are not sent on the next."""
+    responses.add(
+        responses.GET,
+        "http://example.com/login",
+        body="ok",
+        headers={"Set-Cookie": "session=abc; Path=/"},
+        status=200,
+    )
+    responses.add(responses.GET, "http://example.com/me", body="ok", status=200)
+
+    http_request("http://example.com/login")
+    http_request("http://example.com/me")
+
+    assert "Cookie" not in responses.calls[1].request.headers
@@ -0,0 +1,149 @@
+"""Tests for the web_search tool."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler
+from typing import Any, ClassVar
+
+import pytest
+
+from deepagents_cli import tools
+from deepagents_cli.tools import web_search
+
+
+class _FakeTavilyClient:
+    calls: ClassVar[list[tuple[int, str, dict[str, Any]]]] = []
+
+    def __init__(self, api_key: str, client: object = None) -> None:
+        self.api_key = api_key
+        self.client = client
+
+    async def search(self, query: str, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append((id(self), query, kwargs))
+        await asyncio.sleep(0.05)
+        return {"query": query, "results": [{"title": "T", "url": "https://t.example"}]}
+
+
+@pytest.fixture(autouse=True)
+def fake_tavily(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[_FakeTavilyClient]]:
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    monkeypatch.setattr(tools, "AsyncTavilyClient", _FakeTavilyClient)
+    monkeypatch.setattr(_FakeTavilyClient, "calls", [])
+    monkeypatch.setattr(tools, "_SEARCH_BATCHER", tools._SearchBatcher())
+    tools._SEARCH_CACHE.clear()
+    tools._NEWS_SEARCH_CACHE.clear()
+    yield _FakeTavilyClient
+    tools._SEARCH_BATCHER.close()
+
+
+def test_web_search_missing_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing API key is reported without calling Tavily."""
+    monkeypatch.delenv("TAVILY_API_KEY")
+
+    result = web_search("anything")
+
+    assert "TAVILY_API_KEY" in result["error"]
+
+
+def test_web_search_caches_repeat_queries(fake_tavily: type[_FakeTavilyClient]) -> None:
+    """Test that identical searches are served from the cache as independent copies."""
+    first = web_search("python asyncio")
+    first["results"].clear()
+    second = web_search("python asyncio")
+
+    assert len(fake_tavily.calls) == 1
+    assert second["results"] == [{"title": "T", "url": "https://t.example"}]
+
+
+def test_web_search_cache_key_includes_arguments(fake_tavily: type[_FakeTavilyClient]) -> None:
+    """Test that searches differing in any argument are cached separately."""
+    web_search("python asyncio")
+    web_search("python asyncio", max_results=10)
+    web_search("python asyncio", topic="news")
+
+    assert len(fake_tavily.calls) == 3
+
+
+def test_web_search_errors_are_not_cached(
+    fake_tavily: type[_FakeTavilyClient], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that failed searches are retried rather than cached."""
+
+    async def failing_search(self: _FakeTavilyClient, query: str, **kwargs: Any) -> dict:
+        self.calls.append((id(self), query, kwargs))
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(_FakeTavilyClient, "search", failing_search)
+
+    assert "boom" in web_search("flaky")["error"]
+    assert "boom" in web_search("flaky")["error"]
+    assert len(fake_tavily.calls) == 2
+
+
+def test_web_search_reuses_client_across_batches(fake_tavily: type[_FakeTavilyClient]) -> None:
+    """Test that separate batches share one Tavily client and its connections."""
+    web_search("first")
+    web_search("second")
+
+    assert len({client_id for client_id, _, _ in fake_tavily.calls}) == 1
+
+
+def test_web_search_batches_concurrent_calls(
+    fake_tavily: type[_FakeTavilyClient], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that searches issued together share a batch and duplicates share a request."""
+    monkeypatch.setattr(tools, "_SEARCH_BATCHER", tools._SearchBatcher(max_wait=0.2))
+    queries = ["alpha", "beta", "gamma", "alpha"]
+    results: dict[int, dict[str, Any]] = {}
+
+    def run(index: int, query: str) -> None:
+        results[index] = web_search(query)
+
+    threads = [threading.Thread(target=run, args=item) for item in enumerate(queries)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(query for _, query, _ in fake_tavily.calls) == ["alpha", "beta", "gamma"]
+    assert len({client_id for client_id, _, _ in fake_tavily.calls}) == 1
+    assert [results[i]["query"] for i in range(len(queries))] == queries
+    assert results[0] is not results[3]
+
+
+def test_warm_web_search_preconnects_to_tavily(
+    fake_tavily: type[_FakeTavilyClient],
+    monkeypatch: pytest.MonkeyPatch,
+    serve: Callable[[type[BaseHTTPRequestHandler]], str],
+) -> None:
+    """Test that warming opens a connection to Tavily without running a search."""
+    connected = threading.Event()
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self) -> None:
+            connected.set()
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    monkeypatch.setattr(tools, "_TAVILY_API_URL", serve(_Handler))
+
+    tools.warm_web_search()
+
+    assert connected.wait(timeout=5)
+    assert list(tools._SEARCH_BATCHER._clients) == ["test-key"]
+    assert fake_tavily.calls == []
+
+
+def test_warm_web_search_without_api_key_starts_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that warming is a no-op when no Tavily API key is configured."""
+    monkeypatch.delenv("TAVILY_API_KEY")
+
+    tools.warm_web_search()
+
+    assert tools._SEARCH_BATCHER._loop is None